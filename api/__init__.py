@@ -1,11 +1,27 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from lib.config import Config
 
+# Records are handed to a background listener thread through a queue, so request
+# coroutines never block on the stdout write.
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler(sys.stdout)  # Ensure logs go to stdout for Vercel
+_log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Leave the message bare; the listener's handler applies the real format
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 logging.basicConfig(
     level=Config.LOG_LEVEL,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    stream=sys.stdout,  # Ensure logs go to stdout for Vercel
+    handlers=[_log_queue_handler],
 )
 
 logger = logging.getLogger(__name__)
@@ -1,58 +1,80 @@
-from fastapi import APIRouter, HTTPException, Depends, Request as FastAPIRequest
+from fastapi import APIRouter, HTTPException, Depends, Query, Request as FastAPIRequest
+from fastapi.responses import ORJSONResponse, Response
 from typing import List
-import requests.exceptions
-from lib.models import AirportInfo
+from lib.config import CACHE_TTL
+from lib.models import AirportInfo, AIRPORT_LIST_ADAPTER
 from lib.ryanair_client import RyanairAPIClient
 
-# from lib.config import Config # No longer needed directly here
-
 router = APIRouter()
 
 
-# Dependency to get RyanairAPIClient from app.state
-def get_ryanair_client(
+# Dependency to get RyanairAPIClient from app.state. Declared async so FastAPI
+# calls it inline instead of handing it to the threadpool on every request.
+async def get_ryanair_client(
     fast_api_request: FastAPIRequest,
 ) -> RyanairAPIClient:  # Use FastAPIRequest
     return fast_api_request.app.state.ryanair_client
 
 
-@router.get("/airports", response_model=List[AirportInfo], tags=["Airports"])
-async def get_all_airports(client: RyanairAPIClient = Depends(get_ryanair_client)):
+@router.get(
+    "/airports",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[AirportInfo]}},
+    tags=["Airports"],
+)
+async def get_all_airports(
+    fast_api_request: FastAPIRequest,
+    client: RyanairAPIClient = Depends(get_ryanair_client),
+):
     """
     Get a list of all Ryanair airports.
     """
-    try:
-        airports = await client.get_airports()
-        if not airports:  # Added check for empty list from client
-            # This could mean primary and fallback failed, or simply no airports (unlikely)
-            # Returning 204 No Content might be more appropriate if it's a valid empty result
-            # For now, sticking to 500 if client returns empty, implying an issue.
-            # Or, we can return 404 if client explicitly signals no data found vs error.
-            # Current client returns empty list on errors or no data, so 500 might be too strong.
-            # Let client raise specific exceptions or return None to differentiate.
-            # Assuming client returning empty list means "no data could be fetched/found"
-            raise HTTPException(
-                status_code=404,
-                detail="No airports could be fetched from Ryanair or its fallback.",
-            )
-        return airports
-    except (
-        requests.exceptions.RequestException
-    ) as req_ex:  # Catch specific request errors
-        # Log req_ex here
+    airport_index = await client.get_airport_index()
+    if not airport_index.airports:  # Added check for empty list from client
+        # This could mean primary and fallback failed, or simply no airports (unlikely)
+        # Returning 204 No Content might be more appropriate if it's a valid empty result
+        # For now, sticking to 500 if client returns empty, implying an issue.
+        # Or, we can return 404 if client explicitly signals no data found vs error.
+        # Current client returns empty list on errors or no data, so 500 might be too strong.
+        # Let client raise specific exceptions or return None to differentiate.
+        # Assuming client returning empty list means "no data could be fetched/found"
         raise HTTPException(
-            status_code=503, detail=f"Error connecting to Ryanair services: {req_ex}"
-        )
-    except Exception as e:
-        # Log e here
-        raise HTTPException(
-            status_code=500, detail=f"An unexpected error occurred: {e}"
+            status_code=404,
+            detail="No airports could be fetched from Ryanair or its fallback.",
         )
+    if airport_index.is_fallback:
+        # Degraded list served while the CSV can't be loaded; don't let browsers
+        # or CDNs keep it once the server recovers
+        headers = {"Cache-Control": "no-store", "Vary": "Accept-Encoding"}
+    else:
+        # The list only changes when the client cache refreshes, so serve the
+        # pre-encoded body and let clients revalidate with If-None-Match
+        headers = {
+            "ETag": airport_index.etag,
+            "Cache-Control": f"public, max-age={CACHE_TTL}",
+            "Vary": "Accept-Encoding",
+        }
+        if airport_index.etag_matches(fast_api_request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+    # Compressed variants are built once per load, so a hit costs no CPU
+    content, coding = airport_index.payload_for(
+        fast_api_request.headers.get("accept-encoding")
+    )
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get(
     "/airports/{origin_airport_code}/destinations",
-    response_model=List[AirportInfo],
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[AirportInfo]}},
     tags=["Airports"],
 )
 async def get_destinations(
@@ -61,36 +83,26 @@ async def get_destinations(
     """
     Get a list of available destinations from a specific origin airport.
     """
-    try:
-        destinations = await client.get_destinations_from_origin(
-            origin_airport_code.upper()
-        )
-        if not destinations:
-            # This handles both "origin not found" and "origin has no destinations"
-            raise HTTPException(
-                status_code=404,
-                detail=f"No destinations found for origin airport {origin_airport_code}, or origin airport not valid.",
-            )
-        return destinations
-    except requests.exceptions.RequestException as req_ex:
-        # Log req_ex here
-        raise HTTPException(
-            status_code=503,
-            detail=f"Error connecting to Ryanair services for destinations: {req_ex}",
-        )
-    except HTTPException:  # Re-raise HTTPExceptions (like the 404 above) directly
-        raise
-    except Exception as e:
-        # Log e here
+    destinations = await client.get_destinations_from_origin(
+        origin_airport_code.upper()
+    )
+    if not destinations:
+        # This handles both "origin not found" and "origin has no destinations"
         raise HTTPException(
-            status_code=500,
-            detail=f"An unexpected error occurred while fetching destinations: {e}",
+            status_code=404,
+            detail=f"No destinations found for origin airport {origin_airport_code}, or origin airport not valid.",
         )
+    return Response(
+        content=AIRPORT_LIST_ADAPTER.dump_json(destinations),
+        media_type="application/json",
+    )
 
 
 @router.get(
     "/airports/iata-lookup/{city_name}",
-    response_model=List[AirportInfo],
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[AirportInfo]}},
     tags=["Airports"],
 )
 async def get_iata_by_city(
@@ -99,33 +111,57 @@ async def get_iata_by_city(
     """
     Get a list of airports and their IATA codes for a specific city.
     """
-    try:
-        airports = await client.get_airports()
-        if not airports:
-            raise HTTPException(
-                status_code=404,
-                detail="No airports could be fetched from Ryanair or its fallback.",
-            )
+    airport_index = await client.get_airport_index()
+    if not airport_index.airports:
+        raise HTTPException(
+            status_code=404,
+            detail="No airports could be fetched from Ryanair or its fallback.",
+        )
 
-        matching_airports = [
-            airport
-            for airport in airports
-            if city_name.lower() in airport.city_name.lower()
-        ]
+    matching_airports = airport_index.find_by_city(city_name)
 
-        if not matching_airports:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No airports found for city: {city_name}",
-            )
-        return matching_airports
-    except requests.exceptions.RequestException as req_ex:
+    if not matching_airports:
         raise HTTPException(
-            status_code=503, detail=f"Error connecting to Ryanair services: {req_ex}"
+            status_code=404,
+            detail=f"No airports found for city: {city_name}",
         )
-    except HTTPException:  # Re-raise HTTPExceptions directly
-        raise
-    except Exception as e:
+    return Response(
+        content=AIRPORT_LIST_ADAPTER.dump_json(matching_airports),
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/airports/iata-lookup",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[AirportInfo]}},
+    tags=["Airports"],
+)
+async def get_iata_by_cities(
+    city: List[str] = Query(default=[], description="City names; repeat to look up several"),
+    client: RyanairAPIClient = Depends(get_ryanair_client),
+):
+    """
+    Get a list of airports and their IATA codes for any of several cities.
+    """
+    if not city:
+        raise HTTPException(status_code=400, detail="At least one city is required.")
+    airport_index = await client.get_airport_index()
+    if not airport_index.airports:
+        raise HTTPException(
+            status_code=404,
+            detail="No airports could be fetched from Ryanair or its fallback.",
+        )
+
+    matching_airports = airport_index.find_by_cities(city)
+
+    if not matching_airports:
         raise HTTPException(
-            status_code=500, detail=f"An unexpected error occurred: {e}"
+            status_code=404,
+            detail=f"No airports found for cities: {', '.join(city)}",
         )
+    return Response(
+        content=AIRPORT_LIST_ADAPTER.dump_json(matching_airports),
+        media_type="application/json",
+    )
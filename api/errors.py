@@ -0,0 +1,71 @@
+from fastapi import FastAPI, Request as FastAPIRequest
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import requests.exceptions
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def request_exception_handler(
+    fast_api_request: FastAPIRequest, exc: requests.exceptions.RequestException
+) -> ORJSONResponse:
+    logger.error(
+        f"Ryanair API request failed on {fast_api_request.url.path}: {exc}",
+        exc_info=exc,
+    )
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": f"Error connecting to Ryanair services: {exc}"},
+    )
+
+
+class UnexpectedErrorMiddleware:
+    """
+    Turn any other exception escaping a route into a 500 response. FastAPI runs
+    handlers registered for Exception in ServerErrorMiddleware, outside every
+    user middleware, so their responses would miss the CORS headers; this sits
+    inside the middleware stack instead.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Too late for an error response once the body has started
+            if response_started:
+                raise
+            logger.error(
+                f"An unexpected error occurred on {scope['path']}.", exc_info=exc
+            )
+            response = ORJSONResponse(
+                status_code=500, content={"detail": "An unexpected error occurred."}
+            )
+            await response(scope, receive, send)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Map errors escaping the route handlers to HTTP responses, so the handlers
+    only contain their happy path. HTTPException keeps FastAPI's own handling.
+    Call before adding CORSMiddleware, so error responses pass through it.
+    """
+    app.add_exception_handler(
+        requests.exceptions.RequestException, request_exception_handler
+    )
+    app.add_middleware(UnexpectedErrorMiddleware)
@@ -1,58 +1,83 @@
-from fastapi import APIRouter, HTTPException, Body, Depends, Request as FastAPIRequest
+from fastapi import APIRouter, Body, Depends, HTTPException, Request as FastAPIRequest
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from lib.models import FlightSearchRequest, FlightSearchResponse
-from lib.ryanair_client import RyanairAPIClient
 from lib.flight_analyzer import FlightAnalyzer
-import requests.exceptions
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_ryanair_client(fast_api_request: FastAPIRequest) -> RyanairAPIClient:
-    return fast_api_request.app.state.ryanair_client
+async def get_flight_analyzer(fast_api_request: FastAPIRequest) -> FlightAnalyzer:
+    return fast_api_request.app.state.flight_analyzer
 
 
-@router.post("/flights/search", response_model=FlightSearchResponse, tags=["Flights"])
+@router.post(
+    "/flights/search",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": FlightSearchResponse}},
+    tags=["Flights"],
+)
 async def search_flights_api(
     request_body: FlightSearchRequest = Body(...),
-    client: RyanairAPIClient = Depends(get_ryanair_client),
+    analyzer: FlightAnalyzer = Depends(get_flight_analyzer),
 ):
     """
     Search for flights based on the provided criteria.
     This endpoint supports direct flights and one-stop connections.
     """
+    logger.info(
+        "Received flight search request: %s -> %s on %s",
+        request_body.origin,
+        request_body.destination,
+        request_body.departure_date,
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Flight search request body: %s", request_body.model_dump_json())
     try:
-        analyzer = FlightAnalyzer(client)
-
-        logger.info(
-            f"Received flight search request: {request_body.model_dump_json(indent=2)}"
-        )
         response = await analyzer.search_flights(request_body)
-
-        if not response.flights:
-            logger.info(
-                f"No flights found for request: {request_body.model_dump_json()}"
-            )
-
-        logger.info(f"Returning {len(response.flights)} flight options.")
-        return response
     except ValueError as ve:
         logger.warning(f"Validation error in flight search request: {ve}")
         raise HTTPException(status_code=400, detail=str(ve))
-    except requests.exceptions.RequestException as req_ex:
-        logger.error(
-            f"Ryanair API request failed during flight search: {req_ex}", exc_info=True
-        )
-        raise HTTPException(
-            status_code=503,
-            detail=f"Error communicating with Ryanair services: {req_ex}",
-        )
-    except Exception:
-        logger.error(
-            "An unexpected error occurred during flight search.", exc_info=True
-        )
-        raise HTTPException(
-            status_code=500,
-            detail="An unexpected error occurred while searching for flights.",
-        )
+
+    if not response.flights:
+        logger.info("No flights found for request: %r", request_body)
+
+    logger.info("Returning %d flight options.", len(response.flights))
+    return ORJSONResponse(response.model_dump(by_alias=True))
+
+
+@router.post(
+    "/flights/search/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One FlightOption JSON object per line",
+        }
+    },
+    tags=["Flights"],
+)
+async def stream_flights_api(
+    request_body: FlightSearchRequest = Body(...),
+    analyzer: FlightAnalyzer = Depends(get_flight_analyzer),
+):
+    """
+    Stream flight options as newline-delimited JSON while the search runs.
+    Options are sent as each leg search completes rather than sorted by price,
+    so the first results arrive without waiting for the slowest hub.
+    """
+    logger.info(
+        "Received streaming flight search request: %s -> %s on %s",
+        request_body.origin,
+        request_body.destination,
+        request_body.departure_date,
+    )
+
+    async def body():
+        async for option in analyzer.iter_flights(request_body):
+            yield orjson.dumps(option.model_dump(by_alias=True)) + b"\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
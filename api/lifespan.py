@@ -0,0 +1,16 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warm the airports cache so the first airport request doesn't load the CSV,
+    and release the pooled upstream connections on shutdown.
+    """
+    ryanair_client = app.state.ryanair_client
+    ryanair_client.preload_airports()
+    yield
+    await ryanair_client.close_session()
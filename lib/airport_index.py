@@ -0,0 +1,168 @@
+import gzip
+import hashlib
+import logging
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .config import CACHE_MAXSIZE
+from .models import AirportInfo, AIRPORT_LIST_ADAPTER
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=CACHE_MAXSIZE)
+def _compile_needles(needles: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Alternation matching any of the (lowercased) needles literally"""
+    return re.compile("|".join(re.escape(needle) for needle in needles))
+
+
+class AirportIndex:
+    """Airport list with lookup structures precomputed once per load"""
+
+    def __init__(self, airports: List[AirportInfo], is_fallback: bool = False):
+        self.airports = airports
+        # Built from the hardcoded fallback list because loading the CSV failed
+        self.is_fallback = is_fallback
+
+        # Lowercased city name -> positions in self.airports. Many airports share
+        # a city, so lookups scan the distinct names instead of every airport.
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, airport in enumerate(airports):
+            postings[airport.city_name.lower()].append(position)
+        self._city_postings: Dict[str, List[int]] = dict(postings)
+
+        # All distinct city names packed into one newline-separated string, with
+        # the offset each name starts at, so a lookup is a run of str.find calls
+        # over a single buffer rather than one Python comparison per city
+        self._cities: List[str] = list(self._city_postings)
+        self._city_offsets: List[int] = []
+        offset = 0
+        for city in self._cities:
+            self._city_offsets.append(offset)
+            offset += len(city) + 1
+        self._city_buffer = "\n".join(self._cities)
+
+        # Results of previous lookups, keyed by the lowercased query
+        self._lookup_cache: Dict[str, List[AirportInfo]] = {}
+
+        logger.info(
+            f"Built airport index: {len(airports)} airports, "
+            f"{len(self._city_postings)} distinct cities"
+        )
+
+    def find_by_city(self, city_name: str) -> List[AirportInfo]:
+        """Airports whose city name contains city_name (case-insensitive)"""
+        needle = city_name.lower()
+        cached = self._lookup_cache.get(needle)
+        if cached is not None:
+            return cached
+
+        # A newline can only match across two packed names
+        if "\n" in needle:
+            matches = []
+        else:
+            matches = self._scan(
+                lambda start: self._city_buffer.find(needle, start)
+            )
+
+        if len(self._lookup_cache) >= CACHE_MAXSIZE:
+            self._lookup_cache.clear()
+        self._lookup_cache[needle] = matches
+        return matches
+
+    def find_by_cities(self, city_names: Iterable[str]) -> List[AirportInfo]:
+        """Airports whose city name contains any of city_names (case-insensitive)"""
+        needles = sorted({name.lower() for name in city_names if "\n" not in name})
+        if not needles:
+            return []
+        if len(needles) == 1:
+            return self.find_by_city(needles[0])
+
+        # One pass over the buffer finds the next city matching any needle
+        pattern = _compile_needles(tuple(needles))
+
+        def search(start: int) -> int:
+            match = pattern.search(self._city_buffer, start)
+            return match.start() if match else -1
+
+        return self._scan(search)
+
+    def _scan(self, search: Callable[[int], int]) -> List[AirportInfo]:
+        """
+        Collect the airports of every city the search hits. search(start) returns
+        the buffer offset of the next hit at or after start, or -1.
+        """
+        positions: List[int] = []
+        start = search(0)
+        while start != -1:
+            city_number = bisect_right(self._city_offsets, start) - 1
+            positions.extend(self._city_postings[self._cities[city_number]])
+            # Resume at the next name so each city is reported once
+            city_number += 1
+            if city_number == len(self._cities):
+                break
+            start = search(self._city_offsets[city_number])
+        # Keep the original list order
+        positions.sort()
+        return [self.airports[position] for position in positions]
+
+    @cached_property
+    def payload(self) -> bytes:
+        """JSON body for the full airport list, encoded once per load"""
+        return AIRPORT_LIST_ADAPTER.dump_json(self.airports)
+
+    @cached_property
+    def encoded_payloads(self) -> Dict[str, bytes]:
+        """
+        The payload compressed once per load, keyed by content coding in order
+        of preference. Brotli is only offered when the package is installed.
+        """
+        encoded: Dict[str, bytes] = {}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(self.payload, quality=9)
+        encoded["gzip"] = gzip.compress(self.payload, compresslevel=9, mtime=0)
+        return encoded
+
+    def payload_for(
+        self, accept_encoding: Optional[str]
+    ) -> Tuple[bytes, Optional[str]]:
+        """The best payload for an Accept-Encoding header value, with its coding"""
+        accepted = set()
+        refused = set()
+        for token in (accept_encoding or "").lower().split(","):
+            coding, _, params = token.partition(";")
+            quality = params.strip().removeprefix("q=")
+            try:
+                if params and float(quality) == 0:
+                    # An explicit q=0 refuses the coding, even if "*" is accepted
+                    refused.add(coding.strip())
+                    continue
+            except ValueError:
+                pass
+            accepted.add(coding.strip())
+        for coding, body in self.encoded_payloads.items():
+            if coding in refused:
+                continue
+            if coding in accepted or "*" in accepted:
+                return body, coding
+        return self.payload, None
+
+    @cached_property
+    def etag(self) -> str:
+        """Weak ETag identifying the current payload"""
+        return f'W/"{hashlib.blake2b(self.payload, digest_size=8).hexdigest()}"'
+
+    def etag_matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header value matches the current payload"""
+        if not if_none_match:
+            return False
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in candidates or self.etag in candidates
@@ -0,0 +1,63 @@
+import asyncio
+import time
+from functools import partial
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from .config import CACHE_MAXSIZE
+
+T = TypeVar("T")
+
+
+class CoalescingCache(Generic[T]):
+    """
+    Async lookups by key. Concurrent callers for a key all await the one lookup
+    already in flight instead of each starting their own, and completed results
+    are optionally kept for a TTL chosen per result.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[Callable[[T], float]] = None,
+        maxsize: int = CACHE_MAXSIZE,
+    ):
+        # Seconds to keep a given result for; None shares in-flight lookups only
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # (expires_at, result) per key
+        self._results: Dict[Hashable, Tuple[float, T]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def get(self, key: Hashable, lookup: Callable[[], Awaitable[T]]) -> T:
+        """The result for key: cached, joined in flight, or from a new lookup()"""
+        cached = self._results.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(lookup())
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._finish, key))
+        # Shielded so a caller going away doesn't cancel a lookup others await
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        """Stop routing new callers to a completed lookup and keep its result"""
+        del self._inflight[key]
+        # Reading the exception also marks it retrieved if every caller left
+        if future.cancelled() or future.exception() is not None:
+            return
+        if self._ttl is None:
+            return
+
+        result = future.result()
+        now = time.monotonic()
+        if len(self._results) >= self._maxsize:
+            self._results = {
+                cache_key: entry
+                for cache_key, entry in self._results.items()
+                if now < entry[0]
+            }
+            if len(self._results) >= self._maxsize:
+                self._results.clear()
+        self._results[key] = (now + self._ttl(result), result)
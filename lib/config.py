@@ -1,80 +1,145 @@
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Final
+
+# Settings are module-level constants so hot paths can import them directly
+# (a single global load instead of a Config attribute lookup per access).
+
+# API Configuration
+RYANAIR_API_URL: Final[str] = os.getenv(
+    "RYANAIR_API_URL",
+    "https://www.ryanair.com/api/booking/v4",  # Default from previous RYANAIR_API_BASE_URL
+)
+# Example specific API endpoint URLs (these should be verified with actual Ryanair API docs)
+RYANAIR_FLIGHT_SEARCH_URL: Final[str] = os.getenv(
+    "RYANAIR_FLIGHT_SEARCH_URL",
+    f"{RYANAIR_API_URL}/availability",  # Example, may vary by market etc.
+)
+RYANAIR_AIRPORTS_LIST_URL: Final[str] = os.getenv(
+    "RYANAIR_AIRPORTS_LIST_URL",
+    "https://api.ryanair.com/aggregate/3/commonData/airports",
+)
+RYANAIR_ROUTES_URL: Final[str] = os.getenv(
+    # Example: "https://services-api.ryanair.com/locate/v1/autocomplete/routes?departureAirportIataCode={origin_code}" # noqa: E501
+    # Using a more structured one from client if possible
+    "RYANAIR_ROUTES_URL",
+    "https://www.ryanair.com/api/locate/v2/routes?departureAirportIataCode={origin_code}",  # noqa: E501 # Matches client usage pattern
+)
+
+APIFY_TOKEN: Final[str] = os.getenv("APIFY_TOKEN", "")
+APIFY_BASE_URL: Final[str] = os.getenv("APIFY_BASE_URL", "https://api.apify.com/v2")
+
+# Proxy Settings
+PROXY_SETTINGS: Final[str] = os.getenv("PROXY_SETTINGS", "")
+
+# Default Settings
+DEFAULT_CURRENCY: Final[str] = os.getenv("DEFAULT_CURRENCY", "EUR")
+DEFAULT_FLEX_DAYS: Final[int] = int(
+    os.getenv("DEFAULT_FLEX_DAYS", "0")
+)  # Renamed from DEFAULT_DATE_FLEXIBILITY_DAYS
+
+# Logging Configuration
+LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO")
+
+# Cache Settings
+CACHE_TTL: Final[int] = int(
+    os.getenv("CACHE_TTL", "900")
+)  # Renamed from CACHE_TTL_SECONDS (15 minutes)
+CACHE_MAXSIZE: Final[int] = int(
+    os.getenv("CACHE_MAXSIZE", "1000")
+)  # Renamed from CACHE_MAX_SIZE
+DESTINATIONS_CACHE_TTL: Final[int] = int(
+    os.getenv("DESTINATIONS_CACHE_TTL", "3600")
+)  # Routes served from an origin
+FARES_CACHE_TTL: Final[int] = int(
+    os.getenv("FARES_CACHE_TTL", "600")
+)  # Per-day fares returned by Ryanair
+FARES_EMPTY_CACHE_TTL: Final[int] = int(
+    os.getenv("FARES_EMPTY_CACHE_TTL", "30")
+)  # Days with no fares, rechecked sooner
+
+# Connection Logic Settings (for FlightAnalyzer, not directly client)
+MIN_LAYOVER_MINUTES: Final[int] = int(os.getenv("MIN_LAYOVER_MINUTES", "90"))
+MAX_LAYOVER_MINUTES: Final[int] = int(os.getenv("MAX_LAYOVER_MINUTES", "360"))
+MAX_CONCURRENT_LEG_SEARCHES: Final[int] = int(
+    os.getenv("MAX_CONCURRENT_LEG_SEARCHES", "16")
+)
+MAX_CONCURRENT_DESTINATION_SEARCHES: Final[int] = int(
+    os.getenv("MAX_CONCURRENT_DESTINATION_SEARCHES", "10")
+)
+
+# Request Settings for RyanairAPIClient
+TIMEOUT: Final[int] = int(os.getenv("TIMEOUT", "30"))  # Renamed from REQUEST_TIMEOUT
+CONNECT_TIMEOUT: Final[int] = int(
+    os.getenv("CONNECT_TIMEOUT", "5")
+)  # TCP/TLS setup only
+HTTP_POOL_MAXSIZE: Final[int] = int(
+    os.getenv("HTTP_POOL_MAXSIZE", "32")
+)  # Keep-alive connections per host
+RETRIES: Final[int] = int(os.getenv("RETRIES", "3"))  # Renamed from MAX_RETRIES
+RETRY_DELAY: Final[int] = int(os.getenv("RETRY_DELAY", "1"))  # New, in seconds
+RETRY_BACKOFF_FACTOR: Final[float] = float(
+    os.getenv("RETRY_BACKOFF_FACTOR", "0.3")
+)  # urllib3 Retry backoff between attempts
+
+# Ryanair API Headers
+RYANAIR_HEADERS: Final[Dict[str, str]] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    ),
+    "Accept": "application/json, text/plain, */*",  # Added text/plain for broader compatibility
+    "Accept-Language": "en-US,en;q=0.9",
+    "Content-Type": "application/json;charset=UTF-8",  # Added charset
+    # Add any other common headers Ryanair might expect
+    # "Referer": "https://www.ryanair.com/",
+    # "Origin": "https://www.ryanair.com",
+}
+
+# Airport Data URL (fallback)
+AIRPORTS_CSV_URL: Final[str] = os.getenv(
+    "AIRPORTS_CSV_URL",
+    "https://raw.githubusercontent.com/cohaolain/ryanair-py/develop/ryanair/airports.csv",
+)
+AIRPORTS_DISK_CACHE_PATH: Final[str] = os.getenv(
+    "AIRPORTS_DISK_CACHE_PATH", "/tmp/ryanair_airports.json"
+)  # Parsed airports, survives warm restarts and serverless cold starts
+AIRPORTS_DISK_CACHE_TTL: Final[int] = int(
+    os.getenv("AIRPORTS_DISK_CACHE_TTL", str(30 * 24 * 3600))
+)  # 30 days; the CSV is refreshed about monthly
 
 
 class Config:
-    # API Configuration
-    RYANAIR_API_URL = os.getenv(
-        "RYANAIR_API_URL",
-        "https://www.ryanair.com/api/booking/v4",  # Default from previous RYANAIR_API_BASE_URL
-    )
-    # Example specific API endpoint URLs (these should be verified with actual Ryanair API docs)
-    RYANAIR_FLIGHT_SEARCH_URL = os.getenv(
-        "RYANAIR_FLIGHT_SEARCH_URL",
-        f"{RYANAIR_API_URL}/availability",  # Example, may vary by market etc.
-    )
-    RYANAIR_AIRPORTS_LIST_URL = os.getenv(
-        "RYANAIR_AIRPORTS_LIST_URL",
-        "https://api.ryanair.com/aggregate/3/commonData/airports",
-    )
-    RYANAIR_ROUTES_URL = os.getenv(
-        # Example: "https://services-api.ryanair.com/locate/v1/autocomplete/routes?departureAirportIataCode={origin_code}" # noqa: E501
-        # Using a more structured one from client if possible
-        "RYANAIR_ROUTES_URL",
-        "https://www.ryanair.com/api/locate/v2/routes?departureAirportIataCode={origin_code}",  # noqa: E501 # Matches client usage pattern
-    )
-
-    APIFY_TOKEN = os.getenv("APIFY_TOKEN", "")
-    APIFY_BASE_URL = os.getenv("APIFY_BASE_URL", "https://api.apify.com/v2")
-
-    # Proxy Settings
-    PROXY_SETTINGS = os.getenv("PROXY_SETTINGS", "")
-
-    # Default Settings
-    DEFAULT_CURRENCY = os.getenv("DEFAULT_CURRENCY", "EUR")
-    DEFAULT_FLEX_DAYS = int(
-        os.getenv("DEFAULT_FLEX_DAYS", "0")
-    )  # Renamed from DEFAULT_DATE_FLEXIBILITY_DAYS
-
-    # Logging Configuration
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-
-    # Cache Settings
-    CACHE_TTL = int(
-        os.getenv("CACHE_TTL", "900")
-    )  # Renamed from CACHE_TTL_SECONDS (15 minutes)
-    CACHE_MAXSIZE = int(
-        os.getenv("CACHE_MAXSIZE", "1000")
-    )  # Renamed from CACHE_MAX_SIZE
-
-    # Connection Logic Settings (for FlightAnalyzer, not directly client)
-    MIN_LAYOVER_MINUTES = int(os.getenv("MIN_LAYOVER_MINUTES", "90"))
-    MAX_LAYOVER_MINUTES = int(os.getenv("MAX_LAYOVER_MINUTES", "360"))
-
-    # Request Settings for RyanairAPIClient
-    TIMEOUT = int(os.getenv("TIMEOUT", "30"))  # Renamed from REQUEST_TIMEOUT
-    RETRIES = int(os.getenv("RETRIES", "3"))  # Renamed from MAX_RETRIES
-    RETRY_DELAY = int(os.getenv("RETRY_DELAY", "1"))  # New, in seconds
-
-    # Ryanair API Headers
-    RYANAIR_HEADERS = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        ),
-        "Accept": "application/json, text/plain, */*",  # Added text/plain for broader compatibility
-        "Accept-Language": "en-US,en;q=0.9",
-        "Content-Type": "application/json;charset=UTF-8",  # Added charset
-        # Add any other common headers Ryanair might expect
-        # "Referer": "https://www.ryanair.com/",
-        # "Origin": "https://www.ryanair.com",
-    }
-
-    # Airport Data URL (fallback)
-    AIRPORTS_CSV_URL = os.getenv(
-        "AIRPORTS_CSV_URL",
-        "https://raw.githubusercontent.com/cohaolain/ryanair-py/develop/ryanair/airports.csv",
-    )
+    """Namespace view of the settings above, kept for existing Config.X callers"""
+
+    RYANAIR_API_URL = RYANAIR_API_URL
+    RYANAIR_FLIGHT_SEARCH_URL = RYANAIR_FLIGHT_SEARCH_URL
+    RYANAIR_AIRPORTS_LIST_URL = RYANAIR_AIRPORTS_LIST_URL
+    RYANAIR_ROUTES_URL = RYANAIR_ROUTES_URL
+    APIFY_TOKEN = APIFY_TOKEN
+    APIFY_BASE_URL = APIFY_BASE_URL
+    PROXY_SETTINGS = PROXY_SETTINGS
+    DEFAULT_CURRENCY = DEFAULT_CURRENCY
+    DEFAULT_FLEX_DAYS = DEFAULT_FLEX_DAYS
+    LOG_LEVEL = LOG_LEVEL
+    CACHE_TTL = CACHE_TTL
+    CACHE_MAXSIZE = CACHE_MAXSIZE
+    DESTINATIONS_CACHE_TTL = DESTINATIONS_CACHE_TTL
+    FARES_CACHE_TTL = FARES_CACHE_TTL
+    FARES_EMPTY_CACHE_TTL = FARES_EMPTY_CACHE_TTL
+    MIN_LAYOVER_MINUTES = MIN_LAYOVER_MINUTES
+    MAX_LAYOVER_MINUTES = MAX_LAYOVER_MINUTES
+    MAX_CONCURRENT_LEG_SEARCHES = MAX_CONCURRENT_LEG_SEARCHES
+    MAX_CONCURRENT_DESTINATION_SEARCHES = MAX_CONCURRENT_DESTINATION_SEARCHES
+    TIMEOUT = TIMEOUT
+    CONNECT_TIMEOUT = CONNECT_TIMEOUT
+    HTTP_POOL_MAXSIZE = HTTP_POOL_MAXSIZE
+    RETRIES = RETRIES
+    RETRY_DELAY = RETRY_DELAY
+    RETRY_BACKOFF_FACTOR = RETRY_BACKOFF_FACTOR
+    RYANAIR_HEADERS = RYANAIR_HEADERS
+    AIRPORTS_CSV_URL = AIRPORTS_CSV_URL
+    AIRPORTS_DISK_CACHE_PATH = AIRPORTS_DISK_CACHE_PATH
+    AIRPORTS_DISK_CACHE_TTL = AIRPORTS_DISK_CACHE_TTL
 
 
 # The get_config() function might not be needed if direct class access Config.VALUE is used.
@@ -1,9 +1,23 @@
+import asyncio
+import heapq
 import logging
-from typing import List, Optional
-from datetime import datetime, timedelta
-
-from .config import Config
+import time
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, partial
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+from datetime import timedelta
+
+from .config import (
+    CACHE_MAXSIZE,
+    DESTINATIONS_CACHE_TTL,
+    HTTP_POOL_MAXSIZE,
+    MAX_CONCURRENT_DESTINATION_SEARCHES,
+    MAX_CONCURRENT_LEG_SEARCHES,
+    MAX_LAYOVER_MINUTES,
+    MIN_LAYOVER_MINUTES,
+)
 from .models import (
+    DateFlexibility,
     FlightSearchRequest,
     FlightSearchResponse,
     FlightOption,
@@ -11,12 +25,37 @@ from .models import (
     LayoverInfo,
     RyanairFlightResponse,
 )
+from .coalescing_cache import CoalescingCache
 from .ryanair_client import RyanairAPIClient
 
 logger = logging.getLogger(__name__)
 
-MIN_LAYOVER_MINUTES = Config.MIN_LAYOVER_MINUTES
-MAX_LAYOVER_MINUTES = Config.MAX_LAYOVER_MINUTES
+# Common Ryanair hubs
+MAJOR_HUBS = (
+    "STN",  # London Stansted
+    "DUB",  # Dublin
+    "BGY",  # Milan Bergamo
+    "CRL",  # Brussels Charleroi
+    "BVA",  # Paris Beauvais
+    "CIA",  # Rome Ciampino
+    "MAD",  # Madrid
+    "BCN",  # Barcelona
+    "OPO",  # Porto
+    "EDI",  # Edinburgh
+    "MAN",  # Manchester
+    "BRE",  # Bremen
+    "WMI",  # Warsaw Modlin
+)
+
+# Most options a single search returns, cheapest first
+MAX_SEARCH_RESULTS = 200
+# Most options an ANY-destination search returns, cheapest first
+MAX_ANY_DESTINATION_RESULTS = 100
+# Most destinations an ANY-destination search queries, to bound upstream calls
+MAX_ANY_DESTINATIONS = 50
+
+# Second legs are searched one date at a time
+NO_DATE_FLEXIBILITY = DateFlexibility(departure=0)
 
 
 class FlightAnalyzer:
@@ -24,8 +63,22 @@ class FlightAnalyzer:
 
     def __init__(self, ryanair_client: RyanairAPIClient):
         self.client = ryanair_client
-        self.min_layover = timedelta(minutes=MIN_LAYOVER_MINUTES)
-        self.max_layover = timedelta(minutes=MAX_LAYOVER_MINUTES)
+        # Layover bounds in seconds, for comparing flights' epoch times
+        self.min_layover_seconds = MIN_LAYOVER_MINUTES * 60
+        self.max_layover_seconds = MAX_LAYOVER_MINUTES * 60
+        # Bounds how many leg searches this analyzer has in flight upstream; never
+        # more than the pool keeps alive, since extra requests would pay a fresh
+        # TLS handshake. The client bounds the per-date calls within each search.
+        self._leg_semaphore = asyncio.Semaphore(
+            min(MAX_CONCURRENT_LEG_SEARCHES, HTTP_POOL_MAXSIZE)
+        )
+        # Leg searches still running upstream, which identical callers join.
+        # Results themselves are cached per day by the client.
+        self._shared_searches: CoalescingCache[List[RyanairFlightResponse]] = (
+            CoalescingCache()
+        )
+        # Route lists change rarely: (loaded_at, destination IATA codes) per origin
+        self._destinations_cache: Dict[str, Tuple[float, List[str]]] = {}
 
     async def search_flights(
         self, request: FlightSearchRequest
@@ -36,20 +89,29 @@ class FlightAnalyzer:
             if request.destination.upper() == "ANY":
                 return await self._search_any_destination(request)
 
-            # Search for direct flights
-            direct_flights = await self._search_direct_flights(request)
-
-            # Search for connecting flights if enabled
-            connecting_flights = []
+            # Search for direct flights, and connecting flights if enabled, concurrently
             if request.max_connections > 0:
-                connecting_flights = await self._search_connecting_flights(request)
+                direct_flights, connecting_flights = await asyncio.gather(
+                    self._search_direct_flights(request),
+                    self._search_connecting_flights(request),
+                )
+            else:
+                direct_flights = await self._search_direct_flights(request)
+                connecting_flights = []
 
-            # Combine and sort results
+            # Combine results and keep the cheapest; selecting the top
+            # MAX_SEARCH_RESULTS is cheaper than sorting every option
             all_flights = direct_flights + connecting_flights
-            all_flights.sort(key=lambda x: x.total_price)
+            cheapest_flights = heapq.nsmallest(
+                MAX_SEARCH_RESULTS, all_flights, key=lambda x: x.total_price
+            )
 
-            return FlightSearchResponse(
-                flights=all_flights,
+            # Everything here was built from validated data, so assemble the
+            # response without re-validating each option. Both list fields are
+            # set so model_post_init has nothing to copy.
+            return FlightSearchResponse.model_construct(
+                flights=cheapest_flights,
+                flight_options=cheapest_flights,
                 search_request=request,
                 total_results=len(all_flights),
                 direct_flights_count=len(direct_flights),
@@ -58,8 +120,9 @@ class FlightAnalyzer:
 
         except Exception as e:
             logger.error(f"Flight search failed: {e}")
-            return FlightSearchResponse(
+            return FlightSearchResponse.model_construct(
                 flights=[],
+                flight_options=[],
                 search_request=request,
                 total_results=0,
                 direct_flights_count=0,
@@ -67,6 +130,92 @@ class FlightAnalyzer:
                 error=str(e),
             )
 
+    async def iter_flights(
+        self, request: FlightSearchRequest
+    ) -> AsyncIterator[FlightOption]:
+        """
+        Yield flight options as each underlying search completes, so callers can
+        stream results instead of waiting for every leg. Options arrive in
+        discovery order, not sorted by price.
+        """
+        if request.destination.upper() == "ANY":
+            destinations = await self._get_destinations(request.origin)
+            searches = self._destination_searches(
+                request, destinations[:MAX_ANY_DESTINATIONS]
+            )
+        else:
+            searches = [self._search_direct_flights(request)]
+            if request.max_connections > 0:
+                searches.extend(
+                    self._find_connections_via_hub(request, hub)
+                    for hub in self._get_potential_hubs(
+                        request.origin, request.destination
+                    )
+                )
+
+        tasks = [asyncio.ensure_future(search) for search in searches]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    flight_options = await next_done
+                except Exception as e:
+                    logger.warning(f"Flight search step failed: {e}")
+                    continue
+                for option in flight_options:
+                    yield option
+        finally:
+            # Stop outstanding searches if the consumer goes away early
+            for task in tasks:
+                task.cancel()
+
+    async def _get_destinations(self, origin: str) -> List[str]:
+        """
+        IATA codes of the destinations served from origin, cached for
+        DESTINATIONS_CACHE_TTL seconds
+        """
+        cached = self._destinations_cache.get(origin)
+        if cached is not None and time.monotonic() - cached[0] < DESTINATIONS_CACHE_TTL:
+            return cached[1]
+
+        airports = await self.client.get_destinations_from_origin(origin)
+        destinations = [airport.iata_code for airport in airports]
+        if len(self._destinations_cache) >= CACHE_MAXSIZE:
+            self._destinations_cache.clear()
+        self._destinations_cache[origin] = (time.monotonic(), destinations)
+        return destinations
+
+    @staticmethod
+    def _search_cache_key(request: FlightSearchRequest) -> Tuple:
+        """The request fields the client's search actually depends on"""
+        flexibility_days = 0
+        if request.date_flexibility and request.date_flexibility.departure is not None:
+            flexibility_days = request.date_flexibility.departure
+        return (
+            request.origin,
+            request.destination,
+            request.departure_date,
+            flexibility_days,
+        )
+
+    async def _shared_search(
+        self, request: FlightSearchRequest
+    ) -> List[RyanairFlightResponse]:
+        """
+        Leg search shared between concurrent identical searches. Hub and ANY
+        searches repeat the same legs; callers all await the one search already
+        in flight instead of each issuing their own.
+        """
+        return await self._shared_searches.get(
+            self._search_cache_key(request), partial(self._search_leg, request)
+        )
+
+    async def _search_leg(
+        self, request: FlightSearchRequest
+    ) -> List[RyanairFlightResponse]:
+        """Run one client search, bounded by the analyzer's concurrency limit"""
+        async with self._leg_semaphore:
+            return await self.client.search_flights(request)
+
     async def _search_direct_flights(
         self, request: FlightSearchRequest
     ) -> List[FlightOption]:
@@ -75,11 +224,16 @@ class FlightAnalyzer:
             f"Searching direct flights from {request.origin} to {request.destination}"
         )
 
-        ryanair_flights = await self.client.search_flights(request)
+        ryanair_flights = await self._shared_search(request)
         flight_options = []
 
         for flight in ryanair_flights:
             try:
+                if (
+                    request.max_price is not None
+                    and flight.fare_amount > request.max_price
+                ):
+                    continue
                 option = self._convert_to_flight_option(flight, is_direct=True)
                 if option:
                     flight_options.append(option)
@@ -102,13 +256,16 @@ class FlightAnalyzer:
 
         connecting_flights = []
 
-        for hub in hub_airports:
-            try:
-                connections = await self._find_connections_via_hub(request, hub)
-                connecting_flights.extend(connections)
-            except Exception as e:
-                logger.warning(f"Failed to find connections via {hub}: {e}")
+        # Hubs are independent, so search them all at once
+        results = await asyncio.gather(
+            *[self._find_connections_via_hub(request, hub) for hub in hub_airports],
+            return_exceptions=True,
+        )
+        for hub, connections in zip(hub_airports, results):
+            if isinstance(connections, Exception):
+                logger.warning(f"Failed to find connections via {hub}: {connections}")
                 continue
+            connecting_flights.extend(connections)
 
         return connecting_flights
 
@@ -119,64 +276,76 @@ class FlightAnalyzer:
         logger.info(f"Searching flights from {request.origin} to ANY destination")
 
         # Get all possible destinations from origin
-        destinations = await self.client.get_destinations_from_origin(request.origin)
+        destinations = await self._get_destinations(request.origin)
 
         all_flights = []
-
-        for destination in destinations[:50]:  # Limit to avoid too many requests
-            try:
-                # Create a new request for each destination
-                dest_request = FlightSearchRequest(
-                    origin=request.origin,
-                    destination=destination,
-                    departure_date=request.departure_date,
-                    return_date=request.return_date,
-                    passengers=request.passengers,
-                    date_flexibility=request.date_flexibility,
-                    max_connections=0,  # Only direct flights for ANY searches
+        destinations = destinations[:MAX_ANY_DESTINATIONS]
+        results = await asyncio.gather(
+            *self._destination_searches(request, destinations),
+            return_exceptions=True,
+        )
+        for destination, direct_flights in zip(destinations, results):
+            if isinstance(direct_flights, Exception):
+                logger.warning(
+                    f"Failed to search flights to {destination}: {direct_flights}"
                 )
-
-                direct_flights = await self._search_direct_flights(dest_request)
-                all_flights.extend(direct_flights)
-
-            except Exception as e:
-                logger.warning(f"Failed to search flights to {destination}: {e}")
                 continue
+            all_flights.extend(direct_flights)
 
-        # Sort by price
-        all_flights.sort(key=lambda x: x.total_price)
+        # Cheapest first; only the top MAX_ANY_DESTINATION_RESULTS are returned,
+        # so select rather than sort everything
+        cheapest_flights = heapq.nsmallest(
+            MAX_ANY_DESTINATION_RESULTS, all_flights, key=lambda x: x.total_price
+        )
 
-        return FlightSearchResponse(
-            flights=all_flights[:100],  # Limit results
+        return FlightSearchResponse.model_construct(
+            flights=cheapest_flights,  # Limit results
+            flight_options=cheapest_flights,
             search_request=request,
             total_results=len(all_flights),
             direct_flights_count=len(all_flights),
             connecting_flights_count=0,
         )
 
-    def _get_potential_hubs(self, origin: str, destination: str) -> List[str]:
-        """Get potential hub airports for connections"""
-        # Common Ryanair hubs
-        major_hubs = [
-            "STN",  # London Stansted
-            "DUB",  # Dublin
-            "BGY",  # Milan Bergamo
-            "CRL",  # Brussels Charleroi
-            "BVA",  # Paris Beauvais
-            "CIA",  # Rome Ciampino
-            "MAD",  # Madrid
-            "BCN",  # Barcelona
-            "OPO",  # Porto
-            "EDI",  # Edinburgh
-            "MAN",  # Manchester
-            "BRE",  # Bremen
-            "WMI",  # Warsaw Modlin
-        ]
+    def _destination_searches(
+        self, request: FlightSearchRequest, destinations: List[str]
+    ) -> List[Awaitable[List[FlightOption]]]:
+        """
+        Direct searches from the origin to each destination of an ANY search,
+        sharing one cap on how many this search has in flight at a time
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DESTINATION_SEARCHES)
+
+        async def search_destination(destination: str) -> List[FlightOption]:
+            async with semaphore:
+                # Create a new request for each destination
+                dest_request = self._any_destination_request(request, destination)
+                return await self._search_direct_flights(dest_request)
+
+        return [search_destination(destination) for destination in destinations]
+
+    def _any_destination_request(
+        self, request: FlightSearchRequest, destination: str
+    ) -> FlightSearchRequest:
+        """
+        Direct-only search to one destination of an ANY search: a copy of the
+        validated request with the destination's IATA code swapped in
+        """
+        return request.model_copy(
+            update={
+                "destination": destination,
+                "max_connections": 0,  # Only direct flights for ANY searches
+            }
+        )
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_potential_hubs(origin: str, destination: str) -> Tuple[str, ...]:
+        """Get potential hub airports for connections"""
         # Filter out origin and destination
-        potential_hubs = [hub for hub in major_hubs if hub not in [origin, destination]]
-
-        return potential_hubs
+        return tuple(
+            hub for hub in MAJOR_HUBS if hub != origin and hub != destination
+        )
 
     async def _find_connections_via_hub(
         self, request: FlightSearchRequest, hub: str
@@ -185,18 +354,28 @@ class FlightAnalyzer:
         connections = []
 
         try:
+            # Fields shared by every leg request for this hub: legs are one way.
+            # The values come from the validated request, so the leg requests
+            # are constructed without validating them again.
+            common_kwargs = dict(
+                return_date=None,
+                passengers=request.passengers,
+                max_connections=0,
+            )
+
             # Search first leg: origin to hub
-            first_leg_request = FlightSearchRequest(
+            first_leg_request = FlightSearchRequest.model_construct(
                 origin=request.origin,
                 destination=hub,
                 departure_date=request.departure_date,
-                return_date=None,  # One way for first leg
-                passengers=request.passengers,
                 date_flexibility=request.date_flexibility,  # Pass flexibility for first leg
-                max_connections=0,
+                **common_kwargs,
             )
-            logger.debug(f"First leg request for hub {hub}: {first_leg_request}")
-            first_leg_flights = await self.client.search_flights(first_leg_request)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("First leg request for hub %s: %r", hub, first_leg_request)
+            # Search the first leg on its own: a hub the origin doesn't serve
+            # needs none of the second-leg searches
+            first_leg_flights = await self._shared_search(first_leg_request)
             logger.info(
                 f"Found {len(first_leg_flights)} flights for first leg to {hub}"
             )
@@ -217,7 +396,17 @@ class FlightAnalyzer:
             ):
                 departure_flexibility_days = request.date_flexibility.departure
 
-            all_second_leg_flights = []
+            # For the second leg, we build one FlightSearchRequest and copy it per
+            # date. The date_flexibility for each call to ryanair_client.search_flights
+            # should be 0, as we are already iterating through the flexible dates.
+            second_leg_base_request = FlightSearchRequest.model_construct(
+                origin=hub,
+                destination=request.destination,
+                departure_date=request.departure_date,
+                date_flexibility=NO_DATE_FLEXIBILITY,  # No further flexibility here
+                **common_kwargs,
+            )
+            second_leg_requests = []
 
             # Iterate from -flexibility to +flexibility days for the second leg
             for days_offset in range(
@@ -231,42 +420,43 @@ class FlightAnalyzer:
                     else search_date_dt
                 )
 
-                logger.info(
-                    f"Searching second leg for hub {hub} on {search_date} (offset: {days_offset} days)"
+                second_leg_search_request = second_leg_base_request.model_copy(
+                    update={"departure_date": search_date}
                 )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Second leg request for hub %s on %s: %r",
+                        hub,
+                        search_date,
+                        second_leg_search_request,
+                    )
+                second_leg_requests.append(second_leg_search_request)
+
+            # The second-leg dates are independent searches, so issue them all
+            # at once
+            second_leg_results = await asyncio.gather(
+                *[
+                    self._shared_search(leg_request)
+                    for leg_request in second_leg_requests
+                ],
+                return_exceptions=True,
+            )
 
-                # For the second leg, we create a new FlightSearchRequest.
-                # The date_flexibility for this specific call to ryanair_client.search_flights
-                # should be 0, as we are already iterating through the flexible dates.
-                second_leg_search_request = FlightSearchRequest(
-                    origin=hub,
-                    destination=request.destination,
-                    departure_date=search_date,
-                    return_date=None,  # one way for this leg
-                    passengers=request.passengers,
-                    date_flexibility={
-                        "departure": 0,
-                        "return_date": 0,
-                    },  # No further flexibility here
-                    max_connections=0,
-                )
-                logger.debug(
-                    f"Second leg request for hub {hub} on {search_date}: {second_leg_search_request}"
-                )
+            all_second_leg_flights = []
 
-                try:
-                    current_second_leg_flights = await self.client.search_flights(
-                        second_leg_search_request
-                    )
-                    all_second_leg_flights.extend(current_second_leg_flights)
-                    logger.info(
-                        f"Found {len(current_second_leg_flights)} flights for second leg from {hub} on {search_date}"
-                    )
-                except Exception as e_sl:
+            for second_leg_search_request, current_second_leg_flights in zip(
+                second_leg_requests, second_leg_results
+            ):
+                search_date = second_leg_search_request.departure_date
+                if isinstance(current_second_leg_flights, Exception):
                     logger.warning(
-                        f"Error searching second leg from {hub} on {search_date}: {e_sl}"
+                        f"Error searching second leg from {hub} on {search_date}: {current_second_leg_flights}"
                     )
                     continue
+                all_second_leg_flights.extend(current_second_leg_flights)
+                logger.info(
+                    f"Found {len(current_second_leg_flights)} flights for second leg from {hub} on {search_date}"
+                )
 
             if not all_second_leg_flights:
                 logger.info(
@@ -279,7 +469,7 @@ class FlightAnalyzer:
                 f"Matching {len(first_leg_flights)} first-leg flights with {len(all_second_leg_flights)} second-leg flights for hub {hub}"
             )
             leg_connections = self._match_flight_legs(
-                first_leg_flights, all_second_leg_flights, hub
+                first_leg_flights, all_second_leg_flights, hub, request.max_price
             )
             connections.extend(leg_connections)
             logger.info(f"Found {len(leg_connections)} connections via hub {hub}")
@@ -289,136 +479,94 @@ class FlightAnalyzer:
 
         return connections
 
-    async def _search_second_leg(
-        self,
-        origin: str,
-        destination: str,
-        date: datetime,
-        passengers,
-        date_flexibility_departure: int = 0,
-    ) -> List[RyanairFlightResponse]:
-        """Search for second leg of connection, incorporating flexibility"""
-
-        # Ensure date is a date object, not datetime, for the request
-        search_date_obj = date.date() if hasattr(date, "date") else date
-
-        second_leg_request = FlightSearchRequest(
-            origin=origin,
-            destination=destination,
-            departure_date=search_date_obj,
-            return_date=None,
-            passengers=passengers,
-            date_flexibility={
-                "departure": date_flexibility_departure,
-                "return_date": 0,
-            },  # Pass flexibility
-            max_connections=0,
-        )
-        logger.debug(
-            f"Second leg search request: {second_leg_request.model_dump_json(indent=2)}"
-        )
-        return await self.client.search_flights(second_leg_request)
-
     def _match_flight_legs(
         self,
         first_leg_flights: List[RyanairFlightResponse],
         second_leg_flights: List[RyanairFlightResponse],
         hub: str,
+        max_price: Optional[float] = None,
     ) -> List[FlightOption]:
         """Match first and second leg flights to create valid connections"""
         connections = []
 
+        # Check every flight once here, so the pair loop below can't raise
+        first_leg_flights = self._priced_flights(first_leg_flights)
+        second_leg_flights = self._priced_flights(second_leg_flights)
+
+        # Valid second legs for a first leg form a contiguous run in departure
+        # order, so find that layover window by bisection instead of trying
+        # every pair. The sort is stable, keeping the original order on ties.
+        second_sorted = sorted(second_leg_flights, key=lambda f: f.departure_epoch)
+        second_departures = [flight.departure_epoch for flight in second_sorted]
+
         for first_flight in first_leg_flights:
-            for second_flight in second_leg_flights:
-                try:
-                    connection = self._create_connection(
-                        first_flight, second_flight, hub
-                    )
-                    if connection:
-                        connections.append(connection)
-                except Exception as e:
-                    logger.warning(f"Failed to create connection: {e}")
-                    continue
+            start = bisect_left(
+                second_departures, first_flight.arrival_epoch + self.min_layover_seconds
+            )
+            end = bisect_right(
+                second_departures, first_flight.arrival_epoch + self.max_layover_seconds
+            )
+            for second_flight in second_sorted[start:end]:
+                connection = self._create_connection(
+                    first_flight, second_flight, hub, max_price
+                )
+                if connection:
+                    connections.append(connection)
 
         return connections
 
+    @staticmethod
+    def _priced_flights(
+        flights: List[RyanairFlightResponse],
+    ) -> List[RyanairFlightResponse]:
+        """Flights whose fare can be read as a number; the rest are skipped"""
+        priced = []
+        for flight in flights:
+            try:
+                flight.fare_amount
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"Skipping flight {flight.flight_number} with unreadable fare: "
+                    f"{flight.regular_fare}"
+                )
+                continue
+            priced.append(flight)
+        return priced
+
     def _create_connection(
         self,
         first_flight: RyanairFlightResponse,
         second_flight: RyanairFlightResponse,
         hub: str,
+        max_price: Optional[float] = None,
     ) -> Optional[FlightOption]:
         """Create a connection flight option from two legs"""
 
-        # Validate layover time
-        layover_time = second_flight.departure_time - first_flight.arrival_time
+        # Validate layover time, in whole seconds
+        layover_seconds = second_flight.departure_epoch - first_flight.arrival_epoch
 
-        if layover_time < self.min_layover or layover_time > self.max_layover:
+        if (
+            layover_seconds < self.min_layover_seconds
+            or layover_seconds > self.max_layover_seconds
+        ):
             return None
 
-        # Create flight segments
-        first_segment = FlightSegment(
-            leg_type="outbound",
-            segment_index=0,
-            origin_airport=first_flight.origin,
-            destination_airport=first_flight.destination,
-            departure_datetime=first_flight.departure_time,
-            arrival_datetime=first_flight.arrival_time,
-            flight_number=first_flight.flight_number,
-            operator=first_flight.operator,
-            duration_minutes=(
-                int(first_flight.duration_minutes)
-                if first_flight.duration_minutes
-                else 0
-            ),
-            price=(
-                first_flight.regular_fare.get("amount", 0)
-                if first_flight.regular_fare
-                else 0
-            ),
-            currency=(
-                first_flight.regular_fare.get("currency", "EUR")
-                if first_flight.regular_fare
-                else "EUR"
-            ),
-        )
+        # Drop pairs over the requested ceiling before building anything
+        total_price = first_flight.fare_amount + second_flight.fare_amount
+        if max_price is not None and total_price > max_price:
+            return None
 
-        second_segment = FlightSegment(
-            leg_type="outbound",
-            segment_index=1,
-            origin_airport=second_flight.origin,
-            destination_airport=second_flight.destination,
-            departure_datetime=second_flight.departure_time,
-            arrival_datetime=second_flight.arrival_time,
-            flight_number=second_flight.flight_number,
-            operator=second_flight.operator,
-            duration_minutes=(
-                int(second_flight.duration_minutes)
-                if second_flight.duration_minutes
-                else 0
-            ),
-            price=(
-                second_flight.regular_fare.get("amount", 0)
-                if second_flight.regular_fare
-                else 0
-            ),
-            currency=(
-                second_flight.regular_fare.get("currency", "EUR")
-                if second_flight.regular_fare
-                else "EUR"
-            ),
-        )
+        # Create flight segments
+        first_segment = self._build_segment(first_flight, segment_index=0)
+        second_segment = self._build_segment(second_flight, segment_index=1)
 
         # Create layover info
         layover = LayoverInfo(
             airport=hub,
-            duration_minutes=int(layover_time.total_seconds() / 60),
+            duration_minutes=layover_seconds // 60,
         )
 
-        # Calculate totals
-        total_price = first_segment.price + second_segment.price
-
-        return FlightOption(
+        return FlightOption.model_construct(
             type="one-stop",
             total_price=total_price,
             currency=first_segment.currency,
@@ -431,29 +579,9 @@ class FlightAnalyzer:
     ) -> Optional[FlightOption]:
         """Convert a Ryanair flight response to a FlightOption"""
         try:
-            segment = FlightSegment(
-                leg_type="outbound",
-                segment_index=0,
-                origin_airport=flight.origin,
-                destination_airport=flight.destination,
-                departure_datetime=flight.departure_time,
-                arrival_datetime=flight.arrival_time,
-                flight_number=flight.flight_number,
-                operator=flight.operator,
-                duration_minutes=(
-                    int(flight.duration_minutes) if flight.duration_minutes else 0
-                ),
-                price=(
-                    flight.regular_fare.get("amount", 0) if flight.regular_fare else 0
-                ),
-                currency=(
-                    flight.regular_fare.get("currency", "EUR")
-                    if flight.regular_fare
-                    else "EUR"
-                ),
-            )
+            segment = self._build_segment(flight, segment_index=0)
 
-            return FlightOption(
+            return FlightOption.model_construct(
                 type="direct",
                 total_price=segment.price,
                 currency=segment.currency,
@@ -464,3 +592,27 @@ class FlightAnalyzer:
         except Exception as e:
             logger.error(f"Failed to convert flight to option: {e}")
             return None
+
+    @staticmethod
+    def _build_segment(
+        flight: RyanairFlightResponse, segment_index: int
+    ) -> FlightSegment:
+        """
+        Outbound segment for a flight. The flight was already validated by the
+        client, so the segment is constructed without re-running validation.
+        """
+        return FlightSegment(
+            leg_type="outbound",
+            segment_index=segment_index,
+            origin_airport=flight.origin,
+            destination_airport=flight.destination,
+            departure_datetime=flight.departure_time,
+            arrival_datetime=flight.arrival_time,
+            flight_number=flight.flight_number,
+            operator=flight.operator,
+            duration_minutes=(
+                int(flight.duration_minutes) if flight.duration_minutes else 0
+            ),
+            price=flight.fare_amount,
+            currency=flight.fare_currency,
+        )
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+from typing import Annotated, Optional, List
+from dataclasses import dataclass
 from datetime import date, datetime
+from functools import cached_property
+import calendar
 
 
 class PassengerInfo(BaseModel):
@@ -55,23 +58,36 @@ class FlightSearchRequest(BaseModel):
     )
 
 
-class FlightSegment(BaseModel):
-    leg_type: str = Field(description="'outbound' or 'return'")
-    segment_index: int = Field(description="0 for first segment, 1 for connection")
-    origin_airport: str = Field(description="Origin airport IATA code")
-    destination_airport: str = Field(description="Destination airport IATA code")
-    departure_datetime: datetime = Field(description="Departure date and time")
-    arrival_datetime: datetime = Field(description="Arrival date and time")
-    flight_number: str = Field(description="Flight number")
-    operator: str = Field(description="Airline operator")
-    duration_minutes: int = Field(description="Flight duration in minutes")
-    price: Optional[float] = Field(default=None, description="Segment price")
-    currency: Optional[str] = Field(default=None, description="Price currency")
-
-
-class LayoverInfo(BaseModel):
-    airport: str = Field(description="Layover airport IATA code")
-    duration_minutes: int = Field(description="Layover duration in minutes")
+# Segments and layovers are only ever built by FlightAnalyzer from validated
+# flights, many per search, so they are plain slotted dataclasses. FlightOption
+# still validates and serializes them through pydantic.
+@dataclass(slots=True)
+class FlightSegment:
+    leg_type: Annotated[str, Field(description="'outbound' or 'return'")]
+    segment_index: Annotated[
+        int, Field(description="0 for first segment, 1 for connection")
+    ]
+    origin_airport: Annotated[str, Field(description="Origin airport IATA code")]
+    destination_airport: Annotated[
+        str, Field(description="Destination airport IATA code")
+    ]
+    departure_datetime: Annotated[
+        datetime, Field(description="Departure date and time")
+    ]
+    arrival_datetime: Annotated[datetime, Field(description="Arrival date and time")]
+    flight_number: Annotated[str, Field(description="Flight number")]
+    operator: Annotated[str, Field(description="Airline operator")]
+    duration_minutes: Annotated[int, Field(description="Flight duration in minutes")]
+    price: Annotated[Optional[float], Field(description="Segment price")] = None
+    currency: Annotated[Optional[str], Field(description="Price currency")] = None
+
+
+@dataclass(slots=True)
+class LayoverInfo:
+    airport: Annotated[str, Field(description="Layover airport IATA code")]
+    duration_minutes: Annotated[
+        int, Field(description="Layover duration in minutes")
+    ]
 
 
 class FlightOption(BaseModel):
@@ -126,6 +142,11 @@ class AirportInfo(BaseModel):
     longitude: Optional[float] = Field(default=None, description="Airport longitude")
 
 
+# Built once at import; validates and serializes whole airport lists in one
+# pydantic-core call, without an intermediate dict per airport
+AIRPORT_LIST_ADAPTER = TypeAdapter(List[AirportInfo])
+
+
 class RyanairApiRequestParams(BaseModel):
     """Internal model for Ryanair API requests"""
 
@@ -174,3 +195,23 @@ class RyanairFlightResponse(BaseModel):
     duration_minutes: Optional[int] = None
     regular_fare: Optional[dict] = None
     operator: str = "Ryanair"
+
+    @cached_property
+    def departure_epoch(self) -> int:
+        """Departure as integer epoch seconds, computed once per instance"""
+        return calendar.timegm(self.departure_time.utctimetuple())
+
+    @cached_property
+    def arrival_epoch(self) -> int:
+        """Arrival as integer epoch seconds, computed once per instance"""
+        return calendar.timegm(self.arrival_time.utctimetuple())
+
+    @cached_property
+    def fare_amount(self) -> float:
+        """Fare amount (0 when unpriced), computed once per instance"""
+        return float(self.regular_fare.get("amount", 0)) if self.regular_fare else 0.0
+
+    @cached_property
+    def fare_currency(self) -> str:
+        """Fare currency (EUR when unpriced), computed once per instance"""
+        return self.regular_fare.get("currency", "EUR") if self.regular_fare else "EUR"
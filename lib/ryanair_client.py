@@ -1,19 +1,154 @@
+import asyncio
+import csv
+import io
 import logging
-from typing import List
+import os
+import time
+import orjson
+from typing import List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ryanair import Ryanair
-from datetime import timedelta
-import pandas as pd
+from ryanair.SessionManager import SessionManager
+from ryanair.types import Flight
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from operator import attrgetter
+from pydantic import ValidationError
 
 from .models import (
     FlightSearchRequest,
     RyanairFlightResponse,
     AirportInfo,
+    AIRPORT_LIST_ADAPTER,
+)
+from .airport_index import AirportIndex
+from .coalescing_cache import CoalescingCache
+from .config import (
+    AIRPORTS_CSV_URL,
+    AIRPORTS_DISK_CACHE_PATH,
+    AIRPORTS_DISK_CACHE_TTL,
+    CACHE_TTL,
+    CONNECT_TIMEOUT,
+    FARES_CACHE_TTL,
+    FARES_EMPTY_CACHE_TTL,
+    HTTP_POOL_MAXSIZE,
+    RETRIES,
+    RETRY_BACKOFF_FACTOR,
+    RYANAIR_HEADERS,
+    TIMEOUT,
 )
-from .config import Config
 
 logger = logging.getLogger(__name__)
 
 
+# ryanair-py airports CSV columns and the AirportInfo fields they populate
+AIRPORT_CSV_COLUMNS = {
+    "iata_code": "iata_code",
+    "name": "name",
+    "municipality": "city_name",
+    "iso_country": "country_name",
+    "latitude_deg": "latitude",
+    "longitude_deg": "longitude",
+}
+
+
+# Common European route durations in minutes (rough estimates), keyed by the
+# unordered airport pair so either direction is a single lookup. Other routes
+# fall back to 150 minutes, a typical European flight time.
+ROUTE_DURATIONS = {
+    frozenset(("STN", "SKG")): 200,  # London to Thessaloniki ~3h 20min
+    frozenset(("STN", "BGY")): 120,  # London to Milan ~2h
+    frozenset(("STN", "WMI")): 140,  # London to Warsaw ~2h 20min
+    frozenset(("BGY", "SKG")): 140,  # Milan to Thessaloniki ~2h 20min
+    frozenset(("WMI", "SKG")): 160,  # Warsaw to Thessaloniki ~2h 40min
+}
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests sent without one"""
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class PooledSessionManager(SessionManager):
+    """
+    SessionManager whose session gets the pooled, timeout-bound adapter before
+    the session cookie GET, so a stalled handshake there fails like any other
+    upstream call instead of hanging
+    """
+
+    def __init__(self):
+        self.session = requests.Session()
+        RyanairAPIClient._configure_session(self.session)
+        self._update_session_cookie()
+
+
+class PooledRyanair(Ryanair):
+    """
+    Ryanair client whose queries go out once through the session's adapter.
+    Retries are left to the adapter's urllib3 Retry, which only repeats failed
+    connections and 502/503/504 responses, instead of the library's exponential
+    backoff around every exception. Responses are decoded with orjson, and fares
+    are parsed as in ryanair-py with the flight number formatting memoized.
+    """
+
+    def __init__(self, currency: Optional[str] = None):
+        self.currency = currency
+
+        self._num_queries = 0
+        self.session_manager = PooledSessionManager()
+        self.session = self.session_manager.get_session()
+
+    def _retryable_query(self, url, params=None):
+        self._num_queries += 1
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Surface it as requests' error, as response.json() would
+            raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    def _parse_cheapest_flight(self, flight):
+        currency = flight["price"]["currencyCode"]
+        if self.currency and self.currency != currency:
+            logger.warning(
+                f"Requested cheapest flights in {self.currency} "
+                f"but API responded with fares in {currency}"
+            )
+        departure_airport = flight["departureAirport"]
+        arrival_airport = flight["arrivalAirport"]
+        return Flight(
+            origin=departure_airport["iataCode"],
+            originFull=", ".join(
+                (departure_airport["name"], departure_airport["countryName"])
+            ),
+            destination=arrival_airport["iataCode"],
+            destinationFull=", ".join(
+                (arrival_airport["name"], arrival_airport["countryName"])
+            ),
+            departureTime=datetime.fromisoformat(flight["departureDate"]),
+            flightNumber=self._format_flight_number(flight["flightNumber"]),
+            price=flight["price"]["value"],
+            currency=currency,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_flight_number(flight_number: str) -> str:
+        """'FR1234' -> 'FR 1234', memoized as the same flights recur across searches"""
+        return flight_number[:2] + " " + flight_number[2:]
+
+
 class RyanairAPIClient:
     """Simple client for interacting with Ryanair's API using the ryanair package"""
 
@@ -22,71 +157,88 @@ class RyanairAPIClient:
         currency: str = "EUR",
     ):
         self.currency = currency
-        self.ryanair = Ryanair(currency)
+        # Created on first use: the ryanair package fetches session cookies over
+        # the network in its constructor
+        self.ryanair: Optional[Ryanair] = None
+        self._ryanair_lock = asyncio.Lock()
+        # (loaded_at, index) for the airport list, guarded by _airports_lock
+        self._airports_cache: Optional[Tuple[float, AirportIndex]] = None
+        self._airports_lock = asyncio.Lock()
+        self._airports_preload: Optional[asyncio.Task] = None
+        # Modification time of the disk copy the cached index was built from
+        self._airports_disk_mtime: Optional[float] = None
+        # Fares per (origin, destination, day, currency), shared while in flight
+        self._fares_cache: CoalescingCache[list] = CoalescingCache(ttl=self._fares_ttl)
+        # Bounds concurrent upstream calls to the connections the pool keeps alive
+        self._upstream_semaphore = asyncio.Semaphore(HTTP_POOL_MAXSIZE)
         logger.info(f"RyanairAPIClient initialized with currency: {currency}")
 
+    async def connect(self) -> Ryanair:
+        """Create the underlying ryanair client, once, if it doesn't exist yet"""
+        if self.ryanair is None:
+            async with self._ryanair_lock:
+                if self.ryanair is None:
+                    ryanair = await asyncio.to_thread(PooledRyanair, self.currency)
+                    self.ryanair = ryanair
+                    logger.info("Ryanair session initialized")
+        return self.ryanair
+
+    @staticmethod
+    def _configure_session(session: requests.Session) -> None:
+        """
+        Pool keep-alive connections, bound every upstream call with timeouts and
+        retry transient gateway errors with a short backoff
+        """
+        adapter = TimeoutHTTPAdapter(
+            timeout=(CONNECT_TIMEOUT, TIMEOUT),
+            pool_connections=HTTP_POOL_MAXSIZE,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=RETRIES,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=(502, 503, 504),
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "User-Agent": RYANAIR_HEADERS["User-Agent"],
+                "Accept": RYANAIR_HEADERS["Accept"],
+                "Accept-Language": RYANAIR_HEADERS["Accept-Language"],
+            }
+        )
+
     async def close_session(self):
         """Closes the underlying HTTP session."""
+        if self.ryanair is not None:
+            self.ryanair.session.close()
         logger.info("RyanairAPIClient session closed.")
 
     def _convert_ryanair_flight(
-        self, flight, origin: str, destination: str
+        self, flight: Flight, origin: str, destination: str
     ) -> RyanairFlightResponse:
         """Convert a flight from the ryanair package to our internal format"""
         try:
-            # Get flight attributes with fallbacks
-            flight_number = getattr(flight, "flightNumber", "FR")
-            departure_time = getattr(flight, "departureTime", None)
-
-            # Calculate arrival time if not available (estimate based on departure + duration)
-            arrival_time = getattr(flight, "arrivalTime", None)
-
-            # Try to get duration from flight object
-            duration_minutes = None
-            if hasattr(flight, "duration"):
-                duration_minutes = getattr(flight, "duration", None)
+            departure_time = flight.departureTime
 
-            # If we have departure but no arrival, calculate it from duration
-            if arrival_time is None and departure_time and duration_minutes:
-                from datetime import timedelta
-
-                arrival_time = departure_time + timedelta(minutes=duration_minutes)
-            elif arrival_time is None and departure_time:
-                # Fallback: estimate based on typical flight time for route
-                from datetime import timedelta
-
-                # For European routes, estimate 1-4 hours based on distance
-                estimated_duration = self._estimate_flight_duration(origin, destination)
-                arrival_time = departure_time + timedelta(minutes=estimated_duration)
-                duration_minutes = estimated_duration
-
-            # Calculate duration from times if not available
-            if duration_minutes is None and departure_time and arrival_time:
-                duration_delta = arrival_time - departure_time
-                duration_minutes = int(duration_delta.total_seconds() / 60)
+            # The fares API returns no arrival time or duration, so estimate both
+            # from the typical flight time for the route
+            duration_minutes = self._estimate_flight_duration(origin, destination)
+            arrival_time = departure_time + timedelta(minutes=duration_minutes)
 
             # Extract pricing information
-            regular_fare = None
-            if hasattr(flight, "price"):
-                price_value = getattr(flight, "price", 0)
-                currency_value = getattr(flight, "currency", self.currency)
-                regular_fare = {
-                    "amount": float(price_value) if price_value else 0.0,
-                    "currency": currency_value,
-                }
-            elif hasattr(flight, "regularFare"):
-                fare_obj = getattr(flight, "regularFare", None)
-                if fare_obj:
-                    regular_fare = {
-                        "amount": getattr(fare_obj, "amount", 0.0),
-                        "currency": getattr(fare_obj, "currency", self.currency),
-                    }
-
-            logger.debug(f"Flight attributes: {dir(flight)}")
-            logger.debug(f"Extracted price info: {regular_fare}")
+            regular_fare = {
+                "amount": float(flight.price) if flight.price else 0.0,
+                "currency": flight.currency,
+            }
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Flight attributes: %s", dir(flight))
+                logger.debug("Extracted price info: %s", regular_fare)
 
             return RyanairFlightResponse(
-                flight_number=flight_number,
+                flight_number=flight.flightNumber,
                 origin=origin,
                 destination=destination,
                 departure_time=departure_time,
@@ -102,26 +254,7 @@ class RyanairAPIClient:
 
     def _estimate_flight_duration(self, origin: str, destination: str) -> int:
         """Estimate flight duration based on common routes (in minutes)"""
-        # Common European route durations (rough estimates)
-        route_durations = {
-            ("STN", "SKG"): 200,  # London to Thessaloniki ~3h 20min
-            ("STN", "BGY"): 120,  # London to Milan ~2h
-            ("STN", "WMI"): 140,  # London to Warsaw ~2h 20min
-            ("BGY", "SKG"): 140,  # Milan to Thessaloniki ~2h 20min
-            ("WMI", "SKG"): 160,  # Warsaw to Thessaloniki ~2h 40min
-        }
-
-        # Check both directions
-        route_key = (origin, destination)
-        reverse_key = (destination, origin)
-
-        if route_key in route_durations:
-            return route_durations[route_key]
-        elif reverse_key in route_durations:
-            return route_durations[reverse_key]
-        else:
-            # Default fallback based on typical European flight times
-            return 150  # 2.5 hours average
+        return ROUTE_DURATIONS.get(frozenset((origin, destination)), 150)
 
     async def search_flights(
         self, request: FlightSearchRequest
@@ -151,47 +284,33 @@ class RyanairAPIClient:
                 f"between {date_from} and {date_to} (flexibility: +/- {flexibility_days} days)"
             )
 
+            ryanair = await self.connect()
             all_flights = []
 
-            # Iterate through each date in the flexible range to get ALL flights from each date
-            current_date = date_from
-            while current_date <= date_to:
-                try:
-                    logger.debug(f"Searching flights for specific date: {current_date}")
-
-                    # Search for flights on this specific date only
-                    # Use the same date for both from and to to get flights for just this day
-                    daily_flights = self.ryanair.get_cheapest_flights(
-                        request.origin, current_date, current_date
-                    )
-
-                    # Filter flights to the desired destination
-                    matching_daily_flights = [
-                        flight
-                        for flight in daily_flights
-                        if flight.destination == request.destination
-                    ]
-
-                    logger.debug(
-                        f"Found {len(matching_daily_flights)} flights on {current_date}"
-                    )
-
-                    # Add all flights from this date to our collection
-                    for flight in matching_daily_flights:
-                        # Add date information to help identify which date this flight is from
-                        logger.debug(
-                            f"Adding flight {flight.flightNumber} from {current_date} "
-                            f"with price {getattr(flight, 'price', 'N/A')}"
-                        )
-                        all_flights.append(flight)
+            # Fetch every date in the flexible range at once; each date is a
+            # separate blocking call made from a worker thread. Dates are
+            # formatted for the API once here, and ryanair-py passes strings on
+            # as they are
+            search_dates = [
+                (date_from + timedelta(days=offset)).isoformat()
+                for offset in range((date_to - date_from).days + 1)
+            ]
+            daily_results = await asyncio.gather(
+                *[
+                    self._search_day(ryanair, request.origin, request.destination, day)
+                    for day in search_dates
+                ],
+                return_exceptions=True,
+            )
 
-                except Exception as e:
+            for current_date, daily_flights in zip(search_dates, daily_results):
+                if isinstance(daily_flights, Exception):
                     logger.warning(
-                        f"Error searching flights for date {current_date}: {e}"
+                        f"Error searching flights for date {current_date}: {daily_flights}"
                     )
-
-                # Move to next date
-                current_date += timedelta(days=1)
+                    continue
+                # Add all flights from this date to our collection
+                all_flights.extend(daily_flights)
 
             logger.info(
                 f"Found total of {len(all_flights)} flights from {request.origin} to {request.destination} "
@@ -212,12 +331,7 @@ class RyanairAPIClient:
             )
 
             # Sort by departure date and then by price to show flights chronologically
-            converted_flights.sort(
-                key=lambda x: (
-                    x.departure_time,
-                    x.regular_fare.get("amount", 0) if x.regular_fare else 0,
-                )
-            )
+            converted_flights.sort(key=attrgetter("departure_time", "fare_amount"))
 
             return converted_flights
 
@@ -225,70 +339,226 @@ class RyanairAPIClient:
             logger.error(f"Error searching flights: {e}")
             raise
 
-    async def get_airports(self) -> List[AirportInfo]:
-        """Get list of airports from the ryanair-py CSV data"""
-        logger.info("Getting airports list")
-        try:
-            logger.info(f"Loading airports from CSV URL: {Config.AIRPORTS_CSV_URL}")
-            # Load airports data from the CSV URL in config
-            df = pd.read_csv(Config.AIRPORTS_CSV_URL, index_col=0)
-            logger.info(f"Successfully loaded CSV with {len(df)} rows")
-
-            # Filter for airports that have IATA codes (Ryanair typically uses IATA codes)
-            airports_with_iata = df[df["iata_code"].notna()]
-            logger.info(f"Found {len(airports_with_iata)} airports with IATA codes")
-
-            # Convert to our AirportInfo model
-            airports = []
-            for _, row in airports_with_iata.iterrows():
-                try:
-                    airport_info = AirportInfo(
-                        iata_code=row["iata_code"],
-                        name=row["name"],
-                        city_name=(
-                            row["municipality"] if pd.notna(row["municipality"]) else ""
-                        ),
-                        country_name=(
-                            row["iso_country"] if pd.notna(row["iso_country"]) else ""
-                        ),
-                        latitude=(
-                            float(row["latitude_deg"])
-                            if pd.notna(row["latitude_deg"])
-                            else 0.0
-                        ),
-                        longitude=(
-                            float(row["longitude_deg"])
-                            if pd.notna(row["longitude_deg"])
-                            else 0.0
-                        ),
-                    )
-                    airports.append(airport_info)
-                except Exception as row_error:
-                    logger.warning(f"Error processing airport row: {row_error}")
-                    continue
+    async def _search_day(
+        self, ryanair: Ryanair, origin: str, destination: str, day: str
+    ) -> list:
+        """
+        Flights from origin to destination departing on one YYYY-MM-DD date, cached
+        for FARES_CACHE_TTL seconds (FARES_EMPTY_CACHE_TTL when empty).
+        Concurrent lookups of the same day share the one upstream call in flight.
+        """
+        return await self._fares_cache.get(
+            (origin, destination, day, self.currency),
+            partial(self._fetch_day, ryanair, origin, destination, day),
+        )
+
+    @staticmethod
+    def _fares_ttl(daily_flights: list) -> float:
+        """Seconds to keep one day's fares; empty days are rechecked sooner"""
+        return FARES_CACHE_TTL if daily_flights else FARES_EMPTY_CACHE_TTL
+
+    async def _fetch_day(
+        self, ryanair: Ryanair, origin: str, destination: str, day: str
+    ) -> list:
+        """Query Ryanair for the flights from origin to destination on one date"""
+        logger.debug(f"Searching flights for specific date: {day}")
+
+        # Use the same date for both from and to: oneWayFares returns only the
+        # cheapest fare per route in the window, so a wider range would collapse
+        # the days into one flight. The API filters to the destination itself.
+        # The ryanair package is blocking; run it off the event loop, at most
+        # one call per pooled connection at a time
+        async with self._upstream_semaphore:
+            daily_flights = await asyncio.to_thread(
+                ryanair.get_cheapest_flights,
+                origin,
+                day,
+                day,
+                destination_airport=destination,
+            )
 
-            logger.info(f"Successfully processed {len(airports)} airports")
-            return airports
+        logger.debug(f"Found {len(daily_flights)} flights on {day}")
+        return daily_flights
 
-        except Exception as e:
-            logger.error(f"Error loading airports from CSV: {e}", exc_info=True)
-            # Return a minimal fallback list of major airports
-            logger.info("Returning fallback airport list")
-            return self._get_fallback_airports()
+    def preload_airports(self) -> None:
+        """Start loading the airport index in the background, once per client"""
+        if self._airports_preload is None:
+            self._airports_preload = asyncio.create_task(self.get_airport_index())
+
+    async def get_airports(self) -> List[AirportInfo]:
+        """Get list of airports, cached in-process for CACHE_TTL seconds"""
+        index = await self.get_airport_index()
+        return index.airports
+
+    async def get_airport_index(self) -> AirportIndex:
+        """Get the airport list with its lookup index, cached for CACHE_TTL seconds"""
+        async with self._airports_lock:
+            if self._airports_cache is not None:
+                loaded_at, index = self._airports_cache
+                if time.monotonic() - loaded_at < CACHE_TTL:
+                    logger.debug("Serving airports list from cache")
+                    return index
+                # Nothing to reload while the disk copy the index was built from
+                # is unchanged: keep it, with its encoded payloads and ETag
+                disk_mtime = self._fresh_disk_copy_mtime()
+                if disk_mtime is not None and disk_mtime == self._airports_disk_mtime:
+                    logger.debug("Airports disk copy unchanged, renewing cache")
+                    self._airports_cache = (time.monotonic(), index)
+                    return index
+
+            logger.info("Getting airports list")
+            try:
+                # Downloading, parsing and encoding the list all block; keep them
+                # off the event loop so other requests are served meanwhile
+                index = await asyncio.to_thread(self._build_airport_index)
+            except Exception as e:
+                logger.error(f"Error loading airports from CSV: {e}", exc_info=True)
+                # Return a minimal fallback list of major airports (not cached,
+                # so the next request retries the CSV)
+                logger.info("Returning fallback airport list")
+                return AirportIndex(self._get_fallback_airports(), is_fallback=True)
+
+            self._airports_cache = (time.monotonic(), index)
+            return index
+
+    def _build_airport_index(self) -> AirportIndex:
+        """Load the airports and build their index, with the /airports payloads"""
+        index = AirportIndex(self._load_airports_cached())
+        # Encode now, in the worker thread, rather than on the first request
+        index.encoded_payloads, index.etag
+        return index
+
+    def _load_airports_cached(self) -> List[AirportInfo]:
+        """
+        Load airports from the on-disk copy while it is younger than
+        AIRPORTS_DISK_CACHE_TTL, otherwise from the CSV, refreshing the copy
+        """
+        path = AIRPORTS_DISK_CACHE_PATH
+        disk_mtime = self._fresh_disk_copy_mtime()
+        if disk_mtime is not None:
+            try:
+                with open(path, "rb") as cache_file:
+                    airports = AIRPORT_LIST_ADAPTER.validate_json(cache_file.read())
+                logger.info(f"Loaded {len(airports)} airports from {path}")
+                self._airports_disk_mtime = disk_mtime
+                return airports
+            except (OSError, ValidationError) as e:
+                logger.warning(f"Ignoring unreadable airports cache {path}: {e}")
+
+        airports = self._load_airports()
+        try:
+            # Write then rename, so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as cache_file:
+                cache_file.write(AIRPORT_LIST_ADAPTER.dump_json(airports))
+            os.replace(tmp_path, path)
+            self._airports_disk_mtime = os.path.getmtime(path)
+        except OSError as e:
+            logger.warning(f"Could not write airports cache {path}: {e}")
+        return airports
+
+    @staticmethod
+    def _fresh_disk_copy_mtime() -> Optional[float]:
+        """Modification time of the airports disk copy, None if missing or expired"""
+        try:
+            mtime = os.path.getmtime(AIRPORTS_DISK_CACHE_PATH)
+        except OSError:
+            return None
+        if time.time() - mtime >= AIRPORTS_DISK_CACHE_TTL:
+            return None
+        return mtime
+
+    def _load_airports(self) -> List[AirportInfo]:
+        """Load the list of airports from the ryanair-py CSV data"""
+        logger.info(f"Loading airports from CSV URL: {AIRPORTS_CSV_URL}")
+        rows = csv.reader(io.StringIO(self._fetch_airports_csv()))
+        header = next(rows)
+        iata, name, city, country, latitude, longitude = (
+            header.index(column) for column in AIRPORT_CSV_COLUMNS
+        )
+
+        # Keep airports that have IATA codes (Ryanair typically uses IATA codes);
+        # truncated rows are skipped, and bad values are left for validation to
+        # reject row by row
+        width = len(header)
+        records = [
+            {
+                "iata_code": row[iata],
+                "name": row[name],
+                "city_name": row[city],
+                "country_name": row[country],
+                "latitude": self._parse_coordinate(row[latitude]),
+                "longitude": self._parse_coordinate(row[longitude]),
+            }
+            for row in rows
+            if len(row) >= width and row[iata]
+        ]
+        logger.info(f"Found {len(records)} airports with IATA codes")
+        airports = self._validate_airport_records(records)
+
+        logger.info(f"Successfully processed {len(airports)} airports")
+        return airports
+
+    @staticmethod
+    def _parse_coordinate(value: str):
+        """
+        A CSV coordinate as a float, 0.0 when empty. Unparseable values are
+        returned as they are so validation drops just that row.
+        """
+        if not value:
+            return 0.0
+        try:
+            # float() keeps the CSV value exactly; pydantic's str coercion can
+            # round the last digit
+            return float(value)
+        except ValueError:
+            return value
+
+    @staticmethod
+    def _fetch_airports_csv() -> str:
+        """Text of the airports CSV at AIRPORTS_CSV_URL, a URL or local path"""
+        source = AIRPORTS_CSV_URL
+        if source.startswith(("http://", "https://")):
+            response = requests.get(
+                source, timeout=(CONNECT_TIMEOUT, TIMEOUT)
+            )
+            response.raise_for_status()
+            return response.text
+        with open(source, encoding="utf-8", newline="") as csv_file:
+            return csv_file.read()
+
+    @staticmethod
+    def _validate_airport_records(records: List[dict]) -> List[AirportInfo]:
+        """Validate airport records into AirportInfo models, skipping invalid rows"""
+        try:
+            return AIRPORT_LIST_ADAPTER.validate_python(records)
+        except ValidationError as e:
+            invalid_rows = {error["loc"][0] for error in e.errors()}
+            logger.warning(
+                f"Skipping {len(invalid_rows)} invalid airport rows: {e.errors()[:3]}"
+            )
+            return AIRPORT_LIST_ADAPTER.validate_python(
+                [
+                    record
+                    for position, record in enumerate(records)
+                    if position not in invalid_rows
+                ]
+            )
 
     def _get_fallback_airports(self) -> List[AirportInfo]:
         """Fallback airport list for when CSV loading fails"""
+        # Static, known-good values: build without running validation
         fallback_airports = [
-            AirportInfo(iata_code="DUB", name="Dublin Airport", city_name="Dublin", country_name="Ireland"),
-            AirportInfo(iata_code="STN", name="London Stansted Airport", city_name="London", country_name="United Kingdom"),
-            AirportInfo(iata_code="BGY", name="Milan Bergamo Airport", city_name="Milan", country_name="Italy"),
-            AirportInfo(iata_code="CRL", name="Brussels South Charleroi Airport", city_name="Brussels", country_name="Belgium"),
-            AirportInfo(iata_code="BVA", name="Paris Beauvais Airport", city_name="Paris", country_name="France"),
-            AirportInfo(iata_code="CIA", name="Rome Ciampino Airport", city_name="Rome", country_name="Italy"),
-            AirportInfo(iata_code="MAD", name="Madrid Barajas Airport", city_name="Madrid", country_name="Spain"),
-            AirportInfo(iata_code="BCN", name="Barcelona El Prat Airport", city_name="Barcelona", country_name="Spain"),
-            AirportInfo(iata_code="OPO", name="Porto Airport", city_name="Porto", country_name="Portugal"),
-            AirportInfo(iata_code="EDI", name="Edinburgh Airport", city_name="Edinburgh", country_name="United Kingdom"),
+            AirportInfo.model_construct(iata_code="DUB", name="Dublin Airport", city_name="Dublin", country_name="Ireland"),
+            AirportInfo.model_construct(iata_code="STN", name="London Stansted Airport", city_name="London", country_name="United Kingdom"),
+            AirportInfo.model_construct(iata_code="BGY", name="Milan Bergamo Airport", city_name="Milan", country_name="Italy"),
+            AirportInfo.model_construct(iata_code="CRL", name="Brussels South Charleroi Airport", city_name="Brussels", country_name="Belgium"),
+            AirportInfo.model_construct(iata_code="BVA", name="Paris Beauvais Airport", city_name="Paris", country_name="France"),
+            AirportInfo.model_construct(iata_code="CIA", name="Rome Ciampino Airport", city_name="Rome", country_name="Italy"),
+            AirportInfo.model_construct(iata_code="MAD", name="Madrid Barajas Airport", city_name="Madrid", country_name="Spain"),
+            AirportInfo.model_construct(iata_code="BCN", name="Barcelona El Prat Airport", city_name="Barcelona", country_name="Spain"),
+            AirportInfo.model_construct(iata_code="OPO", name="Porto Airport", city_name="Porto", country_name="Portugal"),
+            AirportInfo.model_construct(iata_code="EDI", name="Edinburgh Airport", city_name="Edinburgh", country_name="United Kingdom"),
         ]
         return fallback_airports
 
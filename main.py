@@ -1,22 +1,31 @@
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 import os
 from api import flights, airports, health
+from api.errors import register_exception_handlers
+from api.lifespan import lifespan
 from lib.ryanair_client import RyanairAPIClient
-from lib.config import Config
+from lib.flight_analyzer import FlightAnalyzer
+from lib.config import DEFAULT_CURRENCY
 
 app = FastAPI(
     title="Ryanair Flight Scanner API",
     description="API for searching Ryanair flights, including direct and connecting flights.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
+register_exception_handlers(app)
 
 # Initialize RyanairAPIClient instance globally for Vercel
 ryanair_client = RyanairAPIClient(
-    currency=Config.DEFAULT_CURRENCY,
+    currency=DEFAULT_CURRENCY,
 )
 app.state.ryanair_client = ryanair_client
+# The analyzer keeps no per-request state, so one instance serves every search
+app.state.flight_analyzer = FlightAnalyzer(ryanair_client)
+
 
 # Include routers
 app.include_router(health.router, prefix="/api")